@@ -1,22 +1,30 @@
 '''
 Class used to query SNMP from devices using v2 or v3 and maintain data in a cache (based on provided timeout)
-Cache data format:
+Cache data format (LRU ordered, bounded by max_cache_entries):
 {
-    "[[mib]]": {
-        "[[object]]": {
-            "max_age": [[max age in minutes]]
-            "query_time": [[timestamp when data queried]]
-            "data": [[data for the MIB]]
-        }
+    ("[[mib]]", "[[object]]"): {
+        "max_age": [[max age in minutes]]
+        "query_time": [[timestamp when data queried]]
+        "data": [[data for the MIB]]
     }
 }
 
 '''
 import asyncio
 import os
-import json
+import sys
+import hashlib
+import pickle
+import logging
+try:
+    # use orjson when available - parses the MIB JSON files several times faster than the stdlib
+    import orjson as _json
+except ImportError:
+    import json as _json
 from time import time
-from threading import Lock
+from threading import Lock, Thread
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import puresnmp
 from logging_handler import create_logger, INFO, DEBUG
 from datetime import datetime, timedelta
@@ -24,17 +32,48 @@ from .helpers import *
 from .creds import SnmpCredV2, SnmpCredV3
 
 
+def _format_bits(value, mib_syntax):
+    ''' Format a BITS field using the bits info from the MIB syntax (if present) '''
+    for x, y in mib_syntax.get('bits', {}).items():
+        if y == int.from_bytes(value, 'big'):
+            return {'value': value, 'enumeration': x}
+    return value
+
+# dispatch table keyed by the normalized (lowercase) MIB type - avoids chained string compares per cell
+_FORMATTERS = {
+    'macaddress': lambda value, mib_syntax: mac_binary_to_hex(value),
+    'inetaddress': lambda value, mib_syntax: ip_binary_to_str(value),
+    'ipaddress': lambda value, mib_syntax: ip_binary_to_str(value),
+    'truthvalue': lambda value, mib_syntax: value == 1,
+    'bits': _format_bits,
+}
+
+
 class SnmpCache:
     ''' Class used to query SNMP from devices using v2 or v3 and maintain data in a cache (based on provided timeout) '''
-    def __init__(self, host:str, cred:SnmpCredV2|SnmpCredV3, port=161, v6=False, mib_paths=None, cache_enabled=True, max_cache_age=10, log_level=INFO, debug_return_data=False):
-        self._lock = Lock()
+    # fixed attribute set - saves the per-instance __dict__ and speeds up attribute lookup
+    __slots__ = ('_struct_lock', '_stripe_locks', '_logger', 'debug_return_data', 'host', 'port', 'v6',
+                 '_cache', '_oid_index', 'max_cache_age', 'cache_max_entries', 'bulk_repetitions',
+                 '_snmp', '_loop', '_loop_thread', 'cache_enabled', 'cred', 'mibs')
+
+    def __init__(self, host:str, cred:SnmpCredV2|SnmpCredV3, port=161, v6=False, mib_paths=None, cache_enabled=True, max_cache_age=10, max_cache_entries=1024, bulk_repetitions=25, log_level=INFO, debug_return_data=False):
+        # per (mib, table) stripe locks protect each cache entry, the struct lock protects the
+        # top level mibs/cache dict structure - polls of different tables never contend
+        self._struct_lock = Lock()
+        self._stripe_locks = defaultdict(Lock)
         self._logger = create_logger(log_level, name=self.__class__.__name__)
         self.debug_return_data = debug_return_data
         self.host = host
         self.port = port
         self.v6 = v6
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._oid_index = {}
         self.max_cache_age = max_cache_age
+        self.cache_max_entries = max_cache_entries
+        self.bulk_repetitions = bulk_repetitions
+        self._snmp = None
+        self._loop = None
+        self._loop_thread = None
         self.cache_enabled = cache_enabled
         # verify credentials
         if isinstance(cred, SnmpCredV3):
@@ -49,107 +88,288 @@ class SnmpCache:
             self.load_mibs(mib_paths)
 
     def __del__(self):
-        pass
+        try:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+        except AttributeError:
+            # interpreter shutdown or __init__ failed before the loop attribute was set
+            pass
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        ''' Return the background event loop for the device, starting it in a daemon thread on first use.
+            Reusing one loop avoids the event loop setup/teardown that asyncio.run pays per call '''
+        if self._loop is None:
+            with self._struct_lock:
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                    self._loop_thread = Thread(target=self._loop.run_forever, daemon=True)
+                    self._loop_thread.start()
+        return self._loop
 
     def load_mibs(self, mib_dirs:list|str):
-        ''' Loads all json mib files in the listed dir(s) '''
-        self.mibs = {}
+        ''' Loads all json mib files in the listed dir(s).  The previously loaded MIB data stays
+            published until the replacement set is fully parsed, so in-flight queries keep working '''
         mib_dir_list = [mib_dirs] if isinstance(mib_dirs, str) else mib_dirs if isinstance(mib_dirs, list) else []
-        with self._lock:
-            for mib_dir in mib_dir_list:
-                if os.path.isdir(mib_dir):
-                    for file_name in os.listdir(mib_dir):
-                        if file_name.endswith('.json'):
-                            self._logger.debug(f'{self.info_str}: Loading MIB {file_name}...')
-                            with open(os.path.join(mib_dir, file_name), 'r', encoding='utf-8') as input_file:
-                                self.mibs[str(file_name.split('.')[0])] = json.load(input_file)
-
-            # loop through the mibs and resolve and constraints from across MIB files
-            for mib_name, mib_content in self.mibs.items():
-                for key, item in mib_content.items():
-                    if isinstance(item, dict) and item.get('class', None) == 'objecttype' and item.get('syntax', {}).get('class', None) == 'type':
-                        # search for objects that have a syntax with a class of type
-                        # Then loop through imports to look for a matching type
-                        for import_key, import_item in mib_content.get('imports', {}).items():
-                            # exclude generic SNMP references
-                            if import_key != 'class' and not str(import_key).startswith('SNMP'):
-                                if item['syntax'].get('type', None) in import_item and 'type' in self.mibs[import_key].get(item['syntax']['type'], {}):
-                                    # if the SNMP field is of a type imported from another MIB copy 'type' from source MIB into 'syntax'
-                                    self._logger.debug(f"{self.info_str}: {mib_name}: {key}: matched type '{item['syntax']['type']}' from MIB {import_key}")
-                                    item['syntax'] = self.mibs[import_key][item['syntax']['type']]['type']
-
-        self._logger.info(f'{self.info_str}: Loaded {len(self.mibs.keys())} MIBS ({self.mibs.keys()})')
+        # fingerprint the MIB files (name, mtime, size) so a previously parsed pickle can be reused across startups
+        mib_files = sorted((file_name, os.path.getmtime(os.path.join(mib_dir, file_name)), os.path.getsize(os.path.join(mib_dir, file_name)))
+                           for mib_dir in mib_dir_list if os.path.isdir(mib_dir)
+                           for file_name in os.listdir(mib_dir) if file_name.endswith('.json'))
+        cache_file = None
+        if mib_files:
+            fingerprint = hashlib.sha256(repr(mib_files).encode()).hexdigest()
+            cache_file = os.path.join(mib_dir_list[0], f'.mib_cache_{fingerprint}.pkl')
+            if os.path.isfile(cache_file):
+                try:
+                    with open(cache_file, 'rb') as input_file:
+                        mibs, oid_index = pickle.load(input_file)
+                    with self._struct_lock:
+                        self.mibs = mibs
+                        self._oid_index = oid_index
+                    self._logger.info('%s: Loaded %s MIBS from cache file (%s)', self.info_str, len(self.mibs.keys()), self.mibs.keys())
+                    return
+                except Exception as e:
+                    self._logger.warning('%s: Unable to load MIB cache file %s: %s', self.info_str, cache_file, e)
+        # parse the MIB files across a thread pool so the disk reads and JSON parsing overlap,
+        # then preprocess into local dicts - the lock is only taken to publish the final result
+        def _load_one(path):
+            with open(path, 'rb') as input_file:
+                return _json.loads(input_file.read())
+
+        mibs_local = {}
+        mib_paths = [(str(file_name.split('.')[0]), os.path.join(mib_dir, file_name))
+                     for mib_dir in mib_dir_list if os.path.isdir(mib_dir)
+                     for file_name in os.listdir(mib_dir) if file_name.endswith('.json')]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {mib_name: executor.submit(_load_one, path) for mib_name, path in mib_paths}
+            for mib_name, future in futures.items():
+                self._logger.debug('%s: Loading MIB %s...', self.info_str, mib_name)
+                mibs_local[mib_name] = future.result()
+
+        # loop through the mibs and resolve and constraints from across MIB files
+        for mib_name, mib_content in mibs_local.items():
+            for key, item in mib_content.items():
+                if isinstance(item, dict) and item.get('class', None) == 'objecttype' and item.get('syntax', {}).get('class', None) == 'type':
+                    # search for objects that have a syntax with a class of type
+                    # Then loop through imports to look for a matching type
+                    for import_key, import_item in mib_content.get('imports', {}).items():
+                        # exclude generic SNMP references
+                        if import_key != 'class' and not str(import_key).startswith('SNMP'):
+                            if item['syntax'].get('type', None) in import_item and 'type' in mibs_local[import_key].get(item['syntax']['type'], {}):
+                                # if the SNMP field is of a type imported from another MIB copy 'type' from source MIB into 'syntax'
+                                if self._logger.isEnabledFor(logging.DEBUG):
+                                    self._logger.debug("%s: %s: %s: matched type '%s' from MIB %s", self.info_str, mib_name, key, item['syntax']['type'], import_key)
+                                item['syntax'] = mibs_local[import_key][item['syntax']['type']]['type']
+
+        # precompute the normalized type token and reverse enumeration map per syntax so
+        # per-cell formatting is a dict lookup instead of repeated .lower() string compares
+        for mib_content in mibs_local.values():
+            for item in mib_content.values():
+                if isinstance(item, dict) and isinstance(item.get('syntax'), dict):
+                    syntax = item['syntax']
+                    if isinstance(syntax.get('class'), str) and syntax['class'].lower() == 'type' and isinstance(syntax.get('type'), str):
+                        syntax['_type_lc'] = sys.intern(syntax['type'].lower())
+                    if isinstance(syntax.get('constraints'), dict) and isinstance(syntax['constraints'].get('enumeration'), dict):
+                        syntax['_enum_rev'] = {item_value: enum_key for enum_key, item_value in syntax['constraints']['enumeration'].items()}
+                    # tag the object so the row loop can skip the formatting call for trivial types
+                    item['_needs_fmt'] = '_type_lc' in syntax
+
+        # precompute index handler plans for table rows so per-row index parsing needs no dict chasing
+        for mib_content in mibs_local.values():
+            for item in mib_content.values():
+                if isinstance(item, dict) and item.get('nodetype') == 'row' and 'indices' in item:
+                    item['_index_plan'] = self._build_index_plan(item['indices'], mibs_local)
+
+        # build a reverse OID->object index per MIB so table parsing can resolve varbinds with a single dict lookup
+        oid_index_local = {}
+        for mib_name, mib_content in mibs_local.items():
+            oid_index_local[mib_name] = {item['oid']: key for key, item in mib_content.items() if isinstance(item, dict) and 'oid' in item}
+
+        # publish the parsed MIB data with a single assignment under the lock
+        with self._struct_lock:
+            self.mibs = mibs_local
+            self._oid_index = oid_index_local
+
+        # persist the parsed MIB data for faster startups (atomic replace so a partial write is never seen)
+        if cache_file is not None:
+            try:
+                with open(cache_file + '.tmp', 'wb') as output_file:
+                    pickle.dump((self.mibs, self._oid_index), output_file, protocol=5)
+                os.replace(cache_file + '.tmp', cache_file)
+            except Exception as e:
+                self._logger.warning('%s: Unable to write MIB cache file %s: %s', self.info_str, cache_file, e)
+
+        self._logger.info('%s: Loaded %s MIBS (%s)', self.info_str, len(self.mibs.keys()), self.mibs.keys())
 
     @property
     def info_str(self):
         ''' Returns the info string for the class (used in logging commands) '''
         return f"{self.host}:{self.port}{' V6' if self.v6 else ''}"
 
+    def _client(self) -> puresnmp.PyWrapper:
+        ''' Return the SNMP client for the device, creating it on first use (reused across queries) '''
+        if self._snmp is None:
+            self._snmp = puresnmp.PyWrapper(puresnmp.Client(self.host, self.cred.creds))
+        return self._snmp
+
+    def _get_cached_table(self, mib:str, table:str, query_cache_max_age=10):
+        ''' Return the cached data for a table if present and within the max age, otherwise None '''
+        with self._stripe_locks[(mib, table)]:
+            entry = self._cache.get((mib, table))
+            if entry is not None:
+                # mark the entry as most recently used, then check the expiry computed at write time
+                # (a writer on another stripe may evict this key between the get and the reorder -
+                # the stripe lock only covers the entry, not the shared LRU ordering)
+                try:
+                    self._cache.move_to_end((mib, table))
+                except KeyError:
+                    # evicted concurrently - treat as a miss
+                    return None
+                now = time()
+                expires_at = entry.get('_expires_at')
+                if expires_at is None:
+                    # entry written without a precomputed expiry - derive it from the saved query max age
+                    expires_at = entry.get('query_time', 0) + min(self.max_cache_age, entry.get('max_age', self.max_cache_age))*60
+                if expires_at > now and entry.get('data', None) is not None:
+                    if self._logger.isEnabledFor(logging.DEBUG):
+                        self._logger.debug("%s: %s: %s: Loaded from cache. Cache age: %s seconds, max age %s seconds", self.info_str, mib, table, now - entry.get('query_time', 0), query_cache_max_age*60)
+                    return entry['data']
+        return None
+
     def get_table(self, mib:str, table:str, allow_cached=True, query_cache_max_age=10):
         ''' Get a specific object from the MIB.  Allow_cached can be disabled to force a live pull.  A max age of the cached data can be specified '''
-        # get from cache
-        with self._lock:
-            if self.cache_enabled and allow_cached:
-                if mib in self._cache.keys() and table in self._cache[mib]:
-                    # compare the query time against the lower of the cache_max_age or the saved query max age
-                    if self._cache[mib][table].get('query_time',0) > time() - min(self.max_cache_age, self._cache[mib][table].get('max_age',self.max_cache_age))*60:
-                        self._logger.debug(f"{self.info_str}: {mib}: {table}: Loaded from cache. Cache age: {time() - self._cache[mib][table].get('query_time',0)} seconds, max age {query_cache_max_age*60} seconds")
-                        if self._cache[mib][table].get('data', None) is not None:
-                            return self._cache[mib][table]['data']
-
-            self._logger.debug(f"{self.info_str}: {mib}: {table}: Polling from device...")
-            # get from device
-            snmp_server = puresnmp.PyWrapper(puresnmp.Client(self.host, self.cred.creds))
-
-            if mib not in self.mibs.keys():
-                raise ValueError(f"MIB {mib} not loaded.  Loaded MIB's: {self.mibs.keys()}")
-            if table not in self.mibs[mib].keys():
-                raise ValueError(f"Object {table} not in MIB {mib}.")
-            table_data = []
-            self._logger.debug(f"{self.info_str}: Table {mib}::{table} Querying Table...")
-            raw_rows = asyncio.run(snmp_server.table(self.mibs[mib][table]['oid']))
-            query_time = time()
-            self._logger.debug(f"{self.info_str}: Table {mib}::{table} returned {len(raw_rows)} records")
-            for raw_row in raw_rows:
-                # start a new row record
-                table_row = {'_query_time': query_time}
-                # loop through the keys and look for the oid in the MIB table
-                for key, value in raw_row.items():
-                    mib_resolved = False
-                    for mib_key, mib_value in self.mibs[mib].items():
-                        if self.mibs[mib][table]['oid'] + '.' + str(key) == mib_value.get('oid'):
-                            # normalize content
-                            mib_resolved = True
-                            table_row[mib_key] = self.__format_snmp_field(value, mib_value['syntax']) if 'syntax' in mib_value else value # type: ignore
-                            break
-                    if not mib_resolved:
-                        if str(key) == '0':
-                            self._mib_table_index(value, mib, table, table_row)
-                        else:
-                            self._logger.warning(f"{self.info_str}: Table {mib}::{table} Returned OID {self.mibs[mib][table]['oid'] + '.' + str(key)} which could not be found in MIB {mib}")
-                            table_row[key] = value
-                table_data.append(table_row)
-            if len(table_data) != len(raw_rows):
-                raise ValueError(f"Parsed rows does not match returned rows! {len(table_data)} / {len(raw_rows)}")
-
-            # update the cache
-            if self.cache_enabled:
-                if mib not in self._cache:
-                    self._cache[mib] = {table:{}}
-                self._cache[mib][table] = {
+        # get from cache (hold the lock only for the dict reads, never across the network round trip)
+        if self.cache_enabled and allow_cached:
+            cached_data = self._get_cached_table(mib, table, query_cache_max_age)
+            if cached_data is not None:
+                return cached_data
+
+        self._logger.debug("%s: %s: %s: Polling from device...", self.info_str, mib, table)
+        # get from device
+        return asyncio.run_coroutine_threadsafe(self._fetch_table(self._client(), mib, table, query_cache_max_age), self._get_loop()).result()
+
+    def get_tables(self, pairs:list, allow_cached=True, query_cache_max_age=10) -> dict:
+        ''' Get a list of (mib, table) pairs, polling all uncached tables concurrently over a single client.
+            Returns a dict keyed by (mib, table) '''
+        results = {}
+        fetch_pairs = []
+        for mib, table in pairs:
+            cached_data = self._get_cached_table(mib, table, query_cache_max_age) if self.cache_enabled and allow_cached else None
+            if cached_data is not None:
+                results[(mib, table)] = cached_data
+            else:
+                fetch_pairs.append((mib, table))
+        if fetch_pairs:
+            self._logger.debug("%s: Polling %s tables from device...", self.info_str, len(fetch_pairs))
+            results.update(asyncio.run_coroutine_threadsafe(self._poll_tables(self._client(), fetch_pairs, query_cache_max_age), self._get_loop()).result())
+        return results
+
+    async def _poll_tables(self, snmp_server, pairs:list, query_cache_max_age=10) -> dict:
+        ''' Poll a list of (mib, table) pairs, pipelining fetch and parse through a queue so
+            parsing one table overlaps the network wait of the others '''
+        results = {}
+        queue = asyncio.Queue()
+
+        async def _producer(mib, table):
+            raw_rows = await self._query_table_rows(snmp_server, mib, table)
+            await queue.put((mib, table, raw_rows, time()))
+
+        async def _produce_all():
+            # always enqueue the sentinel - if a producer raises (bad table, SNMP timeout) the
+            # consumer must still terminate instead of blocking on the queue forever
+            try:
+                await asyncio.gather(*[_producer(mib, table) for mib, table in pairs])
+            finally:
+                await queue.put(None)
+
+        async def _consumer():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                mib, table, raw_rows, query_time = item
+                results[(mib, table)] = self._parse_table_rows(mib, table, raw_rows, query_time, query_cache_max_age)
+
+        await asyncio.gather(_produce_all(), _consumer())
+        return results
+
+    async def _fetch_table(self, snmp_server, mib:str, table:str, query_cache_max_age=10):
+        ''' Query a single table from the device, parse the rows against the loaded MIB data and update the cache '''
+        raw_rows = await self._query_table_rows(snmp_server, mib, table)
+        return self._parse_table_rows(mib, table, raw_rows, time(), query_cache_max_age)
+
+    async def _query_table_rows(self, snmp_server, mib:str, table:str):
+        ''' Query the raw rows for a table from the device '''
+        if mib not in self.mibs.keys():
+            raise ValueError(f"MIB {mib} not loaded.  Loaded MIB's: {self.mibs.keys()}")
+        if table not in self.mibs[mib].keys():
+            raise ValueError(f"Object {table} not in MIB {mib}.")
+        table_oid = self.mibs[mib][table]['oid']
+        self._logger.debug("%s: Table %s::%s Querying Table...", self.info_str, mib, table)
+        # use the bulk variant where available - fetches bulk_repetitions rows per request instead of one
+        if hasattr(snmp_server, 'bulktable'):
+            raw_rows = await snmp_server.bulktable(table_oid, bulk_size=self.bulk_repetitions)
+        else:
+            raw_rows = await snmp_server.table(table_oid)
+        self._logger.debug("%s: Table %s::%s returned %s records", self.info_str, mib, table, len(raw_rows))
+        return raw_rows
+
+    def _parse_table_rows(self, mib:str, table:str, raw_rows:list, query_time:float, query_cache_max_age=10):
+        ''' Parse the raw rows for a table against the loaded MIB data and update the cache '''
+        table_data = []
+        # hoist the attribute/dict lookups out of the row loop - CPython pays a LOAD_ATTR per access
+        mibs_mib = self.mibs[mib]
+        table_oid_dot = mibs_mib[table]['oid'] + '.'
+        oid_index_get = self._oid_index.get(mib, {}).get
+        format_fn = self.__format_snmp_field
+        index_fn = self._mib_table_index
+        for raw_row in raw_rows:
+            # start a new row record
+            table_row = {'_query_time': query_time}
+            # loop through the keys and look for the oid in the MIB table
+            for key, value in raw_row.items():
+                mib_key = oid_index_get(table_oid_dot + str(key))
+                if mib_key is not None:
+                    # normalize content (skip the formatting call entirely for untyped objects)
+                    mib_value = mibs_mib[mib_key]
+                    needs_fmt = mib_value.get('_needs_fmt')
+                    if needs_fmt or (needs_fmt is None and 'syntax' in mib_value):
+                        table_row[mib_key] = format_fn(value, mib_value['syntax']) # type: ignore
+                    else:
+                        table_row[mib_key] = value
+                elif str(key) == '0':
+                    index_fn(value, mib, table, table_row)
+                else:
+                    self._logger.warning("%s: Table %s::%s Returned OID %s which could not be found in MIB %s", self.info_str, mib, table, table_oid_dot + str(key), mib)
+                    table_row[key] = value
+            table_data.append(table_row)
+        if len(table_data) != len(raw_rows):
+            raise ValueError(f"Parsed rows does not match returned rows! {len(table_data)} / {len(raw_rows)}")
+
+        # update the cache (reacquire only the stripe lock for the write) and evict the least
+        # recently used entries once the configured bound is exceeded
+        if self.cache_enabled:
+            with self._stripe_locks[(mib, table)]:
+                self._cache[(mib, table)] = {
                     'max_age': query_cache_max_age,
                     'query_time': query_time,
+                    '_expires_at': query_time + min(self.max_cache_age, query_cache_max_age)*60,
                     'data': table_data
                 }
+                try:
+                    self._cache.move_to_end((mib, table))
+                except KeyError:
+                    # another stripe's eviction already dropped the fresh entry - the cache is
+                    # simply over budget, nothing to reorder
+                    pass
+                while len(self._cache) > self.cache_max_entries:
+                    try:
+                        self._cache.popitem(last=False)
+                    except KeyError:
+                        # cache emptied by a concurrent eviction
+                        break
 
         return table_data
 
-    def walk(self):
-        pass
-
-    def get(self):
-        pass
-
     def get_cache_table_age(self, mib, table) -> timedelta|None:
         ''' Get the cache age of an object and return it '''
         refresh_time = self.get_cache_table_refresh_time(mib, table)
@@ -157,71 +377,78 @@ class SnmpCache:
     
     def get_cache_table_refresh_time(self, mib, table) -> datetime|None:
         ''' Get the cache age of an object and return it '''
-        with self._lock:
-            if mib in self._cache and table in self._cache[mib] and 'query_time' in self._cache[mib][table]:
-                return datetime.fromtimestamp(self._cache[mib][table]['query_time'])
+        # lock free - the chained dict reads are each atomic under the GIL and worst case return None
+        entry = self._cache.get((mib, table))
+        if entry is not None and 'query_time' in entry:
+            return datetime.fromtimestamp(entry['query_time'])
         return None
 
+    def _build_index_plan(self, indices:list, mibs:dict|None=None) -> list:
+        ''' Resolve the index objects of a table row into a list of (object, kind, width) handler tuples '''
+        mibs = self.mibs if mibs is None else mibs
+        index_plan = []
+        for table_index in indices:
+            # get the index variable
+            if table_index.get('module', None) in mibs and table_index.get('object') in mibs[table_index['module']]:
+                syntax = mibs[table_index['module']][table_index['object']].get('syntax', {})
+                kind, width = 'int', 1
+                if syntax.get('class') == 'type':
+                    type_lc = str(syntax.get('type', '')).lower()
+                    if type_lc == 'macaddress':
+                        # If a MAC, grab 6 octets and convert
+                        kind, width = 'mac', 6
+                    elif type_lc == 'inetaddress':
+                        # If an IP, grab 4 octets
+                        kind, width = 'inet', 4
+                index_plan.append((table_index['object'], kind, width))
+        return index_plan
+
     def _mib_table_index(self, value, mib:str, mib_table:str, return_value:dict):
         ''' Parse the table index and update the return_value dict with the relevant fields '''
         if self.mibs[mib][mib_table].get('nodetype') != 'row' or 'indices' not in self.mibs[mib][mib_table]:
             return
+        index_plan = self.mibs[mib][mib_table].get('_index_plan')
+        if index_plan is None:
+            # plan missing (MIB data not preprocessed at load time) - build and attach it now
+            index_plan = self.mibs[mib][mib_table]['_index_plan'] = self._build_index_plan(self.mibs[mib][mib_table]['indices'])
+        # split the index value once - each plan entry consumes its octets from the shared list
+        parts = value.split('.') if isinstance(value, str) else []
         # loop through the index values - there may be multiple combined (and cross MIB's)!
         index_pos = 0
-        for table_index in self.mibs[mib][mib_table]['indices']:
-            # get the index variable
-            if table_index.get('module', None) in self.mibs and table_index.get('object') in self.mibs[table_index['module']]:
-                if self.mibs[table_index['module']][table_index['object']]['syntax']['class'] == 'type' \
-                    and self.mibs[table_index['module']][table_index['object']]['syntax']['type'].lower() == 'macaddress':
-                    # If a MAC, grab 6 octets and convert
-                    try:
-                        return_value[table_index['object']] = mac_decimal_to_hex('.'.join(value.split('.')[index_pos:index_pos+6]))
-                        index_pos += 6
-                    except Exception as e:
-                        self._logger.error(f"{self.info_str}: Error parsing {mib_table} index. Value: {value}, Index: {[table_index['object']]}, Index specification: {self.mibs[mib][mib_table]['indices']},, Error: {e}")
-                        return
-                elif self.mibs[table_index['module']][table_index['object']]['syntax']['class'] == 'type' \
-                    and self.mibs[table_index['module']][table_index['object']]['syntax']['type'].lower() == 'inetaddress':
-                    # If an IP, grab 4 octets
-                    try:
-                        return_value[table_index['object']] = '.'.join(value.split('.')[index_pos:index_pos+4])
-                        index_pos += 4
-                    except Exception as e:
-                        self._logger.error(f"{self.info_str}: Error parsing {mib_table} index. Value: {value}, Index: {[table_index['object']]}, Index specification: {self.mibs[mib][mib_table]['indices']},, Error: {e}")
-                        return
+        for index_object, kind, width in index_plan:
+            try:
+                if kind == 'mac':
+                    return_value[index_object] = mac_decimal_to_hex('.'.join(parts[index_pos:index_pos+width]))
+                elif kind == 'inet':
+                    return_value[index_object] = '.'.join(parts[index_pos:index_pos+width])
                 else:
-                    # grab one octet and set it
-                    try:
-                        return_value[table_index['object']] = int(''.join(value.split('.')[index_pos:index_pos+1]))
-                        index_pos += 1
-                    except Exception as e:
-                        self._logger.error(f"{self.info_str}: Error parsing {mib_table} index. Value: {value}, Index: {[table_index['object']]}, Index specification: {self.mibs[mib]['mib_table']['indices']},, Error: {e}")
-                        return
+                    return_value[index_object] = int(''.join(parts[index_pos:index_pos+width]))
+                index_pos += width
+            except Exception as e:
+                self._logger.error("%s: Error parsing %s index. Value: %s, Index: %s, Index specification: %s,, Error: %s", self.info_str, mib_table, value, [index_object], self.mibs[mib][mib_table]['indices'], e)
+                return
 
     def __format_snmp_field(self, value, mib_syntax):
         ''' Take a value returned by SNMP and format based on the information in the MIB '''
-        if mib_syntax.get('class', None) is None or mib_syntax.get('type', None) is None:
-            # no syntax info, return as is
-            return value
-        if mib_syntax['class'].lower() != 'type':
-            # wrong class, return as is
-            return value
+        type_lc = mib_syntax.get('_type_lc')
+        if type_lc is None:
+            # syntax dict was not preprocessed at load time, normalize here
+            if mib_syntax.get('class', None) is None or mib_syntax.get('type', None) is None:
+                # no syntax info, return as is
+                return value
+            if mib_syntax['class'].lower() != 'type':
+                # wrong class, return as is
+                return value
+            type_lc = mib_syntax['type'].lower()
 
         # run fixups on the type
         return_value = value
-        if mib_syntax['type'].lower() == 'macaddress':
-            return_value = mac_binary_to_hex(value)
-        elif mib_syntax['type'].lower() == 'inetaddress' or mib_syntax['type'].lower() == 'ipaddress':
-            return_value = ip_binary_to_str(value)
-        elif mib_syntax['type'].lower() == 'truthvalue':
-            return_value = True if value == 1 else False
-        elif mib_syntax['type'].lower() == 'bits':
-            # return bits field as after checking for bits info
-            for x,y in mib_syntax.get('bits', {}).items():
-                if y == int.from_bytes(value, 'big'):
-                    return {'value': value, 'enumeration': x}
-            # no need to continue on to check constraints with bits
-            return value
+        formatter = _FORMATTERS.get(type_lc)
+        if formatter is not None:
+            return_value = formatter(value, mib_syntax)
+            if type_lc == 'bits':
+                # bits carry their own enumeration, no need to continue on to check constraints
+                return return_value
         elif isinstance(value, int) or isinstance(value, timedelta):
             pass
         else:
@@ -229,15 +456,16 @@ class SnmpCache:
             try:
                 return_value = value.decode('utf-8')
             except Exception as e:
-                self._logger.warning(f"{self.info_str}: Error decoding {value}: {e}")
-
-        # check against constraints
-        if isinstance(mib_syntax.get('constraints', None), dict):
-            if 'enumeration' in mib_syntax['constraints']:
-                # loop through and add the translated value
-                for key, item in mib_syntax['constraints']['enumeration'].items():
-                    if item == return_value:
-                        return {'value': return_value, 'enumeration': key}
+                self._logger.warning("%s: Error decoding %s: %s", self.info_str, value, e)
+
+        # check against constraints (reverse enumeration map precomputed at load time)
+        enum_rev = mib_syntax.get('_enum_rev')
+        if enum_rev is None and isinstance(mib_syntax.get('constraints', None), dict) and 'enumeration' in mib_syntax['constraints']:
+            enum_rev = {item: key for key, item in mib_syntax['constraints']['enumeration'].items()}
+        if enum_rev is not None:
+            key = enum_rev.get(return_value)
+            if key is not None:
+                return {'value': return_value, 'enumeration': key}
 
         return return_value
 
@@ -3,40 +3,35 @@ Helper functions
 
 '''
 import ipaddress
+import socket
 
 def mac_decimal_to_hex(mac_str: str):
     """ Take the mac address in a decimal string format from SNMP query to a hex based string """
-    octets = mac_str.split('.')
-    mac_address = ''
-    for octet in octets:
-        mac_address = mac_address + str(hex(int(octet))[2:]).zfill(2)
-    return mac_address
+    return bytes(int(octet) for octet in mac_str.split('.')).hex()
 
 
 def mac_binary_to_hex(mac_bytes: bytes):
     """ Take the mac address in byte format and convert to a hex string """
-    mac_address = ''
-    for mac_byte in mac_bytes:
-        mac_address = mac_address + str(hex(mac_byte)[2:]).zfill(2)
-    return mac_address
+    return mac_bytes.hex()
 
 
 def ip_binary_to_str(ip_bytes: bytes):
     """ Take the IP address in byte format and convert to an IP string """
-    ip_address = ''
     if isinstance(ip_bytes, ipaddress.IPv4Address):
         return str(ip_bytes)
-    else:
-        for ip_byte in ip_bytes:
-            ip_address = ip_address +'.' + str(ip_byte)
-        return ip_address[1:]
+    if isinstance(ip_bytes, (bytes, bytearray)):
+        # use the C socket converters for standard v4/v6 address lengths
+        if len(ip_bytes) == 4:
+            return socket.inet_ntoa(bytes(ip_bytes))
+        if len(ip_bytes) == 16:
+            return socket.inet_ntop(socket.AF_INET6, bytes(ip_bytes))
+    return '.'.join(map(str, ip_bytes))
 
 
 def normalize_mac(mac_address: str, delimiter=':'):
     """ Returns the MAC address normalized with the delimeter provided (can be blank) """
     mac_text = mac_address.replace(':', '').replace('-', '')
-    return mac_text[0:2] + delimiter + mac_text[2:4] + delimiter + mac_text[4:6] + delimiter + mac_text[6:8] + \
-        delimiter + mac_text[8:10] + delimiter + mac_text[10:12]
+    return bytes.fromhex(mac_text).hex(delimiter) if delimiter else mac_text
 
 
 def bytes_to_str(array: bytes):